@@ -1,32 +1,100 @@
-__all__ = ["USER_AUTH", "get_current_user_auth"]
+__all__ = [
+    "ACCOUNTS_CLIENT",
+    "SSO_CLIENT",
+    "USER_AUTH",
+    "get_accounts_client",
+    "get_current_user_auth",
+    "get_sso_client",
+]
 
+import json
 from typing import Annotated
 
-from fastapi import Depends
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import httpx
+from fastapi import Depends, Request
+from fastapi.openapi.models import HTTPBearer as HTTPBearerModel
+from fastapi.security.base import SecurityBase
+from joserfc import jws
 
 from src.api.exceptions import IncorrectCredentialsException
+from src.cache import TTLCache
 from src.modules.inh_accounts_sdk import UserTokenData, inh_accounts
 
-bearer_scheme = HTTPBearer(
+
+class BearerTokenScheme(SecurityBase):
+    """
+    Shown in OpenAPI as HTTP Bearer auth, but returns the raw token instead of HTTPAuthorizationCredentials.
+    Returns None when the token is missing, so the error is handled by the caller.
+    """
+
+    def __init__(self, *, scheme_name: str, description: str | None = None, bearerFormat: str | None = None):
+        self.model = HTTPBearerModel(bearerFormat=bearerFormat, description=description)
+        self.scheme_name = scheme_name
+
+    async def __call__(self, request: Request) -> str | None:
+        authorization = request.headers.get("Authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            return authorization[7:].strip() or None
+        return None
+
+
+bearer_scheme = BearerTokenScheme(
     scheme_name="Bearer",
     description="Token from [InNoHassle Accounts](https://innohassle.ru/account/token)",
     bearerFormat="JWT",
-    auto_error=False,  # We'll handle error manually
 )
 
+_token_cache: TTLCache[str, UserTokenData] = TTLCache(maxsize=4096)
+
+
+def _decode_cached(token: str) -> UserTokenData | None:
+    """
+    Decode token with `inh_accounts.decode_token`, remembering valid tokens until their `exp`.
+    Clients send the same token on every request, so signature verification is skipped for repeated ones.
+    """
+    token_data = _token_cache.get(token)
+    if token_data is not None:
+        return token_data
+
+    token_data = inh_accounts.decode_token(token)
+    if token_data is None:
+        return None
+    # Signature is already verified, so claims can be read as is
+    expires_at = json.loads(jws.extract_compact(token.encode()).payload).get("exp")
+    if type(expires_at) is int:
+        _token_cache.set(token, token_data, expires_at=expires_at)
+    return token_data
+
 
 async def get_current_user_auth(
-    bearer: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    token: str | None = Depends(bearer_scheme),
 ) -> UserTokenData:
-    # Prefer header to cookie
-    token = bearer and bearer.credentials
     if not token:
         raise IncorrectCredentialsException(no_credentials=True)
-    token_data = inh_accounts.decode_token(token)
+    token_data = _decode_cached(token)
     if token_data is None:
         raise IncorrectCredentialsException(no_credentials=False)
     return token_data
 
 
 USER_AUTH = Annotated[UserTokenData, Depends(get_current_user_auth)]
+
+
+async def get_sso_client(request: Request) -> httpx.AsyncClient:
+    """
+    Shared client for Omnidesk, created in the app lifespan.
+    """
+    return request.app.state.sso_client
+
+
+SSO_CLIENT = Annotated[httpx.AsyncClient, Depends(get_sso_client)]
+
+
+async def get_accounts_client(request: Request) -> httpx.AsyncClient:
+    """
+    Shared client for InNoHassle Accounts API authorized as a service, created in the app lifespan.
+    """
+    return request.app.state.accounts_client
+
+
+ACCOUNTS_CLIENT = Annotated[httpx.AsyncClient, Depends(get_accounts_client)]
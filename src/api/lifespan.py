@@ -1,13 +1,49 @@
 __all__ = ["lifespan"]
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
+import httpx
 from fastapi import FastAPI
 
+from src.config import settings
+from src.logging_ import logger
+
+
+async def warm_up(client: httpx.AsyncClient, url: str):
+    """
+    Open a keep-alive connection in advance, so the first request does not pay for DNS and TLS.
+    """
+    try:
+        await client.head(url, timeout=3.0)
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to warm up connection to {url}: {e!r}")
+
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     from src.modules.inh_accounts_sdk import inh_accounts  # noqa: E402
 
-    await inh_accounts.update_key_set()
-    yield
+    async with (
+        httpx.AsyncClient(
+            timeout=30.0,
+            # Keep idle connections (including the warmed up one) longer than httpx's default 5 seconds
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50, keepalive_expiry=60.0),
+        ) as sso_client,
+        httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {settings.accounts.api_jwt_token.get_secret_value()}"},
+            base_url=settings.accounts.api_url,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        ) as accounts_client,
+    ):
+        app.state.sso_client = sso_client
+        app.state.accounts_client = accounts_client
+        # Only the key set is required to serve requests, so do not wait for the warm-up
+        warm_up_task = asyncio.create_task(warm_up(sso_client, settings.omnidesk.base_url))
+        try:
+            await inh_accounts.update_key_set()
+            yield
+        finally:
+            warm_up_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await warm_up_task
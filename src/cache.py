@@ -0,0 +1,54 @@
+__all__ = ["TTLCache"]
+
+import time
+from collections import OrderedDict
+
+
+class TTLCache[K, V]:
+    """
+    In-memory LRU cache where every entry also has its own expiration time.
+    """
+
+    maxsize: int
+    ttl: float | None
+    "Default time to live in seconds, used when `expires_at` is not passed to `set`"
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (value, deadline, whether deadline is on the monotonic clock instead of the wall clock)
+        self._data: OrderedDict[K, tuple[V, float, bool]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """
+        Return cached value, or None if it is missing or expired.
+        """
+        cached = self._data.get(key)
+        if cached is None:
+            return None
+        value, deadline, monotonic = cached
+        if (time.monotonic() if monotonic else time.time()) >= deadline:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, expires_at: float | None = None) -> None:
+        """
+        Store value, evicting the least recently used entry if the cache is full.
+
+        :param expires_at: Unix timestamp (e.g. JWT `exp`) when the value expires.
+            If not passed, the value lives for `ttl` seconds measured by the monotonic clock.
+        """
+        if expires_at is not None:
+            self._data[key] = (value, expires_at, False)
+        elif self.ttl is not None:
+            self._data[key] = (value, time.monotonic() + self.ttl, True)
+        else:
+            raise ValueError("Either `expires_at` or `ttl` should be set")
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,9 +1,15 @@
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, SecretStr
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Environment(StrEnum):
     DEVELOPMENT = "development"
@@ -11,7 +17,7 @@ class Environment(StrEnum):
 
 
 class SettingBaseModel(BaseModel):
-    model_config = ConfigDict(use_attribute_docstrings=True, extra="forbid")
+    model_config = ConfigDict(use_attribute_docstrings=True, extra="forbid", frozen=True)
 
 
 class Accounts(SettingBaseModel):
@@ -59,13 +65,21 @@ class Settings(SettingBaseModel):
 
     @classmethod
     def from_yaml(cls, path: Path) -> "Settings":
-        with open(path) as f:
-            yaml_config = yaml.safe_load(f)
-
-        return cls.model_validate(yaml_config)
+        return _load_settings(cls, path.resolve(), path.stat().st_mtime_ns)
 
     @classmethod
     def save_schema(cls, path: Path) -> None:
         with open(path, "w") as f:
             schema = {"$schema": "https://json-schema.org/draft-07/schema", **cls.model_json_schema()}
             yaml.dump(schema, f, sort_keys=False)
+
+
+@lru_cache(maxsize=8)
+def _load_settings(cls: type[Settings], path: Path, mtime_ns: int) -> Settings:
+    """
+    Parse and validate settings file once per modification time.
+    Settings are frozen, so the same instance can be shared between callers.
+    """
+    with open(path) as f:
+        yaml_config = yaml.load(f, Loader=_YamlLoader)
+    return cls.model_validate(yaml_config)
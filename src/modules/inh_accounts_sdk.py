@@ -142,7 +142,7 @@ class InNoHassleAccounts:
                 response = await client.get(url)
                 try:
                     response.raise_for_status()
-                    return UserSchema.model_validate(response.json())
+                    return UserSchema.model_validate_json(response.content)
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 404:
                         continue
@@ -1,20 +1,44 @@
-import datetime
-import urllib.parse
+import time
 
 import httpx
 from fastapi import APIRouter
 from joserfc import jwk, jwt
 
-from src.api.dependencies import USER_AUTH
+from src.api.dependencies import ACCOUNTS_CLIENT, SSO_CLIENT, USER_AUTH
+from src.cache import TTLCache
 from src.config import settings
-from src.modules.inh_accounts_sdk import inh_accounts
+from src.modules.inh_accounts_sdk import UserSchema
 
 router = APIRouter(prefix="/sso", tags=["sso"])
 
+# Secret marker does not change at runtime, so import it as a key only once
+omnidesk_jwt_key = jwk.import_key(settings.omnidesk.jwt_marker.get_secret_value(), "oct")
+
+_accounts_users: TTLCache[str, UserSchema] = TTLCache(maxsize=10_000, ttl=60 * 60)
+
+
+async def get_accounts_user(accounts_client: httpx.AsyncClient, innohassle_id: str) -> UserSchema | None:
+    """
+    Get user from InNoHassle Accounts, remembering found users for an hour.
+    """
+    user = _accounts_users.get(innohassle_id)
+    if user is not None:
+        return user
+
+    response = await accounts_client.get(f"/users/by-id/{innohassle_id}")
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    user = UserSchema.model_validate_json(response.content)
+    _accounts_users.set(innohassle_id, user)
+    return user
+
 
 @router.post("/generate-link")
 async def generate_signin_link(
     current_user: USER_AUTH,
+    sso_client: SSO_CLIENT,
+    accounts_client: ACCOUNTS_CLIENT,
     return_to: str | None = None,
 ) -> str:
     """
@@ -23,11 +47,11 @@ async def generate_signin_link(
     """
 
     # Get user info
-    accounts_user = await inh_accounts.get_user(innohassle_id=current_user.innohassle_id)
+    accounts_user = await get_accounts_user(accounts_client, current_user.innohassle_id)
 
     # Build JWT
-    issued_at = datetime.datetime.now(datetime.UTC)
-    expire = issued_at + datetime.timedelta(minutes=30)
+    issued_at = int(time.time())
+    expire = issued_at + 30 * 60
     payload: dict = {
         "iat": issued_at,
         "exp": expire,
@@ -35,19 +59,16 @@ async def generate_signin_link(
         "name": accounts_user.innopolis_info.name,
         "external_id": current_user.innohassle_id,  # Should we add this?
     }
-    key = jwk.import_key(settings.omnidesk.jwt_marker.get_secret_value(), "oct")
-    encoded_jwt = jwt.encode({"alg": "HS256"}, payload, key)
+    encoded_jwt = jwt.encode({"alg": "HS256"}, payload, omnidesk_jwt_key)
 
-    # Build endpoint for getting redirect link
+    # Build query for getting redirect link
     query_params = {
         "jwt": encoded_jwt,
         "return_to": return_to or settings.omnidesk.default_redirect_to,
     }
-    endpoint = f"{settings.omnidesk.jwt_access_base_url}?{urllib.parse.urlencode(query_params)}"
 
     # Receive redirect link
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(endpoint)
-        resp.raise_for_status()
-        redirect_url = resp.text
-        return redirect_url
+    resp = await sso_client.get(settings.omnidesk.jwt_access_base_url, params=query_params)
+    resp.raise_for_status()
+    redirect_url = resp.text
+    return redirect_url
@@ -0,0 +1,5 @@
+import os
+from pathlib import Path
+
+# Must be set before `src.config` is imported by any test module
+os.environ.setdefault("SETTINGS_PATH", str(Path(__file__).parent / "settings.test.yaml"))
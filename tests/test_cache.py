@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from src.cache import TTLCache
+
+
+def test_get_missing():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    assert cache.get("a") is None
+
+
+def test_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes least recently used
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_uses_monotonic_clock(monkeypatch: pytest.MonkeyPatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    monkeypatch.setattr(time, "time", lambda: 0.0)  # wall clock jump does not matter
+    assert cache.get("a") == 1
+    monkeypatch.setattr(time, "monotonic", lambda: now + 60)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_expires_at_uses_wall_clock(monkeypatch: pytest.MonkeyPatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1, expires_at=now + 10)
+    assert cache.get("a") == 1
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+    assert cache.get("a") is None
+
+
+def test_set_without_expiration():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    with pytest.raises(ValueError):
+        cache.set("a", 1)
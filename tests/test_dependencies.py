@@ -0,0 +1,97 @@
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from joserfc import jwk, jwt
+
+from src.api import dependencies
+from src.cache import TTLCache
+from src.modules.inh_accounts_sdk import UserTokenData, inh_accounts
+
+USER = UserTokenData(innohassle_id="id", email="user@innopolis.university")
+KEY = jwk.import_key("test-key-for-signing-tokens-only!", "oct")
+
+
+def make_token(**claims) -> str:
+    return jwt.encode({"alg": "HS256"}, {"uid": USER.innohassle_id, "email": USER.email, **claims}, KEY)
+
+
+@pytest.fixture
+def decode_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Replace signature verification with a stub that accepts tokens not ending with "invalid".
+    """
+    calls: list[str] = []
+
+    def decode_token(token: str) -> UserTokenData | None:
+        calls.append(token)
+        return None if token.endswith("invalid") else USER
+
+    monkeypatch.setattr(inh_accounts, "decode_token", decode_token)
+    monkeypatch.setattr(dependencies, "_token_cache", TTLCache(maxsize=4096))
+    return calls
+
+
+def test_repeated_token_is_not_verified_again(decode_calls: list[str]):
+    token = make_token(exp=int(time.time()) + 60)
+    assert dependencies._decode_cached(token) == USER
+    assert dependencies._decode_cached(token) == USER
+    assert decode_calls == [token]
+
+
+def test_expired_token_is_verified_again(decode_calls: list[str], monkeypatch: pytest.MonkeyPatch):
+    now = time.time()
+    token = make_token(exp=int(now) + 60)
+    dependencies._decode_cached(token)
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    dependencies._decode_cached(token)
+    assert decode_calls == [token, token]
+
+
+def test_invalid_token_is_not_cached(decode_calls: list[str]):
+    token = make_token(exp=int(time.time()) + 60) + "invalid"
+    assert dependencies._decode_cached(token) is None
+    assert dependencies._decode_cached(token) is None
+    assert decode_calls == [token, token]
+    assert len(dependencies._token_cache) == 0
+
+
+@pytest.mark.parametrize("exp", [None, True, "9999999999"])
+def test_token_without_integer_exp_is_not_cached(decode_calls: list[str], exp):
+    token = make_token() if exp is None else make_token(exp=exp)
+    assert dependencies._decode_cached(token) == USER
+    assert len(dependencies._token_cache) == 0
+
+
+@pytest.fixture
+def bearer_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/token")
+    async def token(value: str | None = Depends(dependencies.bearer_scheme)) -> str | None:
+        return value
+
+    return app
+
+
+@pytest.mark.parametrize(
+    ("authorization", "expected"),
+    [("Bearer abc", "abc"), ("bearer abc", "abc"), ("Bearer ", None), ("Basic abc", None), (None, None)],
+)
+def test_bearer_scheme_reads_token(bearer_app: FastAPI, authorization: str | None, expected: str | None):
+    headers = {"Authorization": authorization} if authorization is not None else {}
+    response = TestClient(bearer_app).get("/token", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_bearer_scheme_in_openapi(bearer_app: FastAPI):
+    schema = bearer_app.openapi()
+    assert schema["components"]["securitySchemes"]["Bearer"] == {
+        "type": "http",
+        "scheme": "bearer",
+        "bearerFormat": "JWT",
+        "description": "Token from [InNoHassle Accounts](https://innohassle.ru/account/token)",
+    }
+    assert schema["paths"]["/token"]["get"]["security"] == [{"Bearer": []}]
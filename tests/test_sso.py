@@ -0,0 +1,42 @@
+import httpx
+import pytest
+
+from src.cache import TTLCache
+from src.modules.sso import routes
+
+USER_JSON = {
+    "id": "id",
+    "innopolis_info": {"email": "user@innopolis.university", "name": "User", "updated_at": "2025-01-01T00:00:00Z"},
+}
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+    monkeypatch.setattr(routes, "_accounts_users", TTLCache(maxsize=10, ttl=60))
+    return []
+
+
+def make_client(requests: list[httpx.Request], status_code: int) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=USER_JSON if status_code == 200 else {})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://accounts.test")
+
+
+@pytest.mark.asyncio
+async def test_found_user_is_cached(requests: list[httpx.Request]):
+    async with make_client(requests, 200) as client:
+        first = await routes.get_accounts_user(client, "id")
+        second = await routes.get_accounts_user(client, "id")
+    assert first is not None and first.innopolis_info.name == "User"
+    assert second is first
+    assert [r.url.path for r in requests] == ["/users/by-id/id"]
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(requests: list[httpx.Request]):
+    async with make_client(requests, 404) as client:
+        assert await routes.get_accounts_user(client, "id") is None
+        assert await routes.get_accounts_user(client, "id") is None
+    assert len(requests) == 2